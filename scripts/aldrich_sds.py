@@ -4,56 +4,85 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import re
 import sys
 import urllib.parse
 from pathlib import Path
-from typing import List, Optional, Tuple
-
-from bs4 import BeautifulSoup
-from curl_cffi import requests
-from curl_cffi.requests import RequestsError
-
-from sds_common import DownloadRecord, build_summary, normalize_languages, print_summary
+from typing import List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+from curl_cffi import CurlOpt
+from curl_cffi.requests import AsyncSession, RequestsError
+
+from sds_common import (
+    BROWSER_IMPERSONATE,
+    DNS_CACHE_TIMEOUT,
+    HTML_ACCEPT,
+    HTTP_VERSION,
+    MAX_CONCURRENT_DOWNLOADS,
+    USER_AGENT,
+    DownloadRecord,
+    JsonCache,
+    build_summary,
+    normalize_languages,
+    parse_aldrich_product_url,
+    print_summary,
+    stream_to_file,
+)
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
+CACHE_DIR = REPO_ROOT / ".cache" / "aldrich"
+SEARCH_CACHE_TTL = 3600
 
-USER_AGENT = (
-    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-    "AppleWebKit/537.36 (KHTML, like Gecko) "
-    "Chrome/126.0.0.0 Safari/537.36"
-)
+PDF_ACCEPT = "application/pdf,application/octet-stream;q=0.9,*/*;q=0.8"
 
-HTML_ACCEPT = (
-    "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8"
-)
+# Accept-Encoding is left to curl_cffi, which negotiates gzip/deflate/br/zstd
+# through CURLOPT_ACCEPT_ENCODING and decodes bodies transparently; setting the
+# header by hand would only narrow that list.
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": HTML_ACCEPT,
+    "Accept-Language": "en-US,en;q=0.9",
+    "Connection": "keep-alive",
+    "Pragma": "no-cache",
+    "Cache-Control": "no-cache",
+}
 
-PDF_ACCEPT = "application/pdf,application/octet-stream;q=0.9,*/*;q=0.8"
+# BeautifulSoup matches attribute patterns with search(), so no trailing ".*".
+PRODUCT_LINK_ID_RE = re.compile(r"NAME-pdp-link-", re.ASCII)
 
 
 class AldrichClient:
     """A client for downloading SDSs from Sigma-Aldrich."""
 
-    def __init__(self) -> None:
-        self.session = requests.Session(impersonate="chrome120")
-        self.session.headers.update(
-            {
-                "User-Agent": USER_AGENT,
-                "Accept": HTML_ACCEPT,
-                "Accept-Language": "en-US,en;q=0.9",
-                "Connection": "keep-alive",
-                "Pragma": "no-cache",
-                "Cache-Control": "no-cache",
-            }
+    def __init__(self, cache: Optional[JsonCache] = None) -> None:
+        self.session = AsyncSession(
+            impersonate=BROWSER_IMPERSONATE,
+            http_version=HTTP_VERSION,
+            curl_options={CurlOpt.DNS_CACHE_TIMEOUT: DNS_CACHE_TIMEOUT},
         )
+        self.session.headers.update(DEFAULT_HEADERS)
+        self.cache = cache
+        self._download_slots = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
 
-    def get_product_url_from_search(
+    async def __aenter__(self) -> "AldrichClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.session.close()
+
+    async def get_product_url_from_search(
         self, search_term: str, country: str, language: str
     ) -> Optional[str]:
         """Search for a product and return the URL of the first result."""
         search_url = f"https://www.sigmaaldrich.com/{country}/{language}/search/{urllib.parse.quote(search_term)}"
+        if self.cache:
+            cached = self.cache.get(search_url)
+            if isinstance(cached, str):
+                return cached
         try:
-            response = self.session.get(
+            response = await self.session.get(
                 search_url,
                 params={
                     "focus": "products",
@@ -66,24 +95,29 @@ class AldrichClient:
                 timeout=60,
             )
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, "html.parser")
-            first_result = soup.find("a", attrs={"id": re.compile(r"NAME-pdp-link-.*")})
+            # Only the product-name anchors matter; skip building the rest of the tree.
+            product_links = SoupStrainer("a", attrs={"id": PRODUCT_LINK_ID_RE})
+            soup = BeautifulSoup(response.content, "lxml", parse_only=product_links)
+            first_result = soup.find("a")
             if first_result and first_result.has_attr("href"):
-                return urllib.parse.urljoin(response.url, first_result["href"])
+                product_url = urllib.parse.urljoin(response.url, first_result["href"])
+                if self.cache:
+                    self.cache.set(search_url, product_url)
+                return product_url
         except RequestsError as exc:
             print(f"Search failed: {exc}")
         return None
 
-    def prime_session(self, product_url: str, accept_language: str) -> None:
+    async def prime_session(self, product_url: str, accept_language: str) -> None:
         """Fetch the product page once to obtain cookies and verify access."""
-        response = self.session.get(
+        response = await self.session.get(
             product_url,
             timeout=60,
             headers={"Accept-Language": accept_language},
         )
         response.raise_for_status()
 
-    def download_sds(
+    async def download_sds(
         self,
         sds_url: str,
         output_path: Path,
@@ -92,8 +126,10 @@ class AldrichClient:
         language: str,
     ) -> Optional[DownloadRecord]:
         accept_language = f"{language}-{country},{language};q=0.9,en-US;q=0.8,en;q=0.7"
+        print(f"\nAttempting SDS download ({language}): {sds_url}")
         try:
-            response = self.session.get(
+            async with self._download_slots, self.session.stream(
+                "GET",
                 sds_url,
                 timeout=90,
                 headers={
@@ -101,23 +137,23 @@ class AldrichClient:
                     "Accept-Language": accept_language,
                     "Referer": product_url,
                 },
-            )
+            ) as response:
+                if response.status_code != 200:
+                    print(f"  Failed ({language}): HTTP {response.status_code}")
+                    return None
+
+                # Decide from the headers alone; a rejected body is never read.
+                content_type = response.headers.get("Content-Type", "")
+                if "pdf" not in content_type.lower():
+                    print(f"  Failed ({language}): unexpected content-type '{content_type}'")
+                    return None
+
+                size = await stream_to_file(response.aiter_content(), output_path)
         except RequestsError as exc:
             print(f"  Failed ({language}): {exc}")
             return None
 
-        if response.status_code != 200:
-            print(f"  Failed ({language}): HTTP {response.status_code}")
-            return None
-
-        content_type = response.headers.get("Content-Type", "")
-        if "pdf" not in content_type.lower():
-            preview = response.text[:200] if response.text else ""
-            print(f"  Failed ({language}): unexpected content-type '{content_type}' ({preview})")
-            return None
-
-        output_path.write_bytes(response.content)
-        print(f"  Saved {output_path}")
+        print(f"  Saved {output_path} ({size / 1024:.1f} KB)")
 
         return DownloadRecord(
             path=output_path,
@@ -129,17 +165,84 @@ class AldrichClient:
         )
 
 
-def parse_product_url(product_url: str) -> Optional[Tuple[str, str, str, str]]:
-    match = re.match(
-        r"https://www\.sigmaaldrich\.com/([A-Z]{2})/([a-z]{2})/product/([^/]+)/([^/?#]+)",
-        product_url,
+async def run(args: argparse.Namespace) -> int:
+    cache = None if args.no_cache else JsonCache(CACHE_DIR, expire_after=SEARCH_CACHE_TTL)
+    async with AldrichClient(cache=cache) as client:
+        if args.search_term:
+            print(f"Searching for '{args.search_term}'...")
+            # Use a default URL to extract country and language
+            default_url = "https://www.sigmaaldrich.com/KR/ko/product/sigald/34873"
+            parsed_default = parse_aldrich_product_url(default_url)
+            if not parsed_default:
+                print("Could not parse default URL.")
+                return 1
+            country, language, _, _ = parsed_default
+
+            product_url = await client.get_product_url_from_search(
+                args.search_term, country, language
+            )
+            if not product_url:
+                print("Could not find a product URL for the given search term.")
+                return 1
+            print(f"Found product URL: {product_url}")
+        else:
+            product_url = args.product_url or args.legacy_product_url
+
+        parsed = parse_aldrich_product_url(product_url)
+        if not parsed:
+            print(f"Invalid product URL format: {product_url}")
+            print("Example: https://www.sigmaaldrich.com/KR/ko/product/sigald/34873")
+            return 1
+
+        country, default_language, brand, product_number = parsed
+        languages = normalize_languages(args.languages) or [default_language]
+
+        accept_language = f"{default_language}-{country},{default_language};q=0.9,en-US;q=0.8,en;q=0.7"
+        try:
+            await client.prime_session(product_url, accept_language)
+        except RequestsError as exc:
+            print(f"Failed to fetch product page: {exc}")
+            return 1
+
+        output_root = (REPO_ROOT / args.output_dir).resolve()
+        output_root.mkdir(parents=True, exist_ok=True)
+
+        print(f"Product number: {product_number}")
+        print(f"Brand: {brand}")
+        print(f"Country code: {country}")
+        print(f"Requested languages: {', '.join(languages)}")
+
+        downloads = []
+        for language in languages:
+            sds_url = f"https://www.sigmaaldrich.com/{country}/{language}/sds/{brand}/{product_number}"
+            filename = f"{product_number}_{country}_{language.upper()}.pdf"
+            output_path = output_root / filename
+            downloads.append(
+                client.download_sds(
+                    sds_url=sds_url,
+                    output_path=output_path,
+                    product_url=product_url,
+                    country=country,
+                    language=language,
+                )
+            )
+
+        results = await asyncio.gather(*downloads)
+        records: List[DownloadRecord] = [record for record in results if record]
+
+    summary = build_summary(
+        provider="aldrich",
+        product_identifier=product_number,
+        product_url=product_url,
+        downloads=records,
+        notes={"brand": brand, "country": country},
     )
-    if not match:
-        return None
-    return match.group(1), match.group(2), match.group(3), match.group(4)
+    print_summary(summary)
 
+    return 0 if records else 1
 
-def main() -> None:
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Download Sigma-Aldrich SDS PDFs without Playwright MCP.",
     )
@@ -171,85 +274,24 @@ def main() -> None:
         default="data/sds_aldrich",
         help="Directory for downloaded PDFs (default: data/sds_aldrich).",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the search page instead of reusing cached search results.",
+    )
 
-    args = parser.parse_args()
-    client = AldrichClient()
-
-    if args.search_term:
-        print(f"Searching for '{args.search_term}'...")
-        # Use a default URL to extract country and language
-        default_url = "https://www.sigmaaldrich.com/KR/ko/product/sigald/34873"
-        parsed_default = parse_product_url(default_url)
-        if not parsed_default:
-            print("Could not parse default URL.")
-            sys.exit(1)
-        country, language, _, _ = parsed_default
-
-        product_url = client.get_product_url_from_search(
-            args.search_term, country, language
-        )
-        if not product_url:
-            print("Could not find a product URL for the given search term.")
-            sys.exit(1)
-        print(f"Found product URL: {product_url}")
-    else:
-        product_url = args.product_url or args.legacy_product_url
-
-    if not product_url:
-        parser.error("Please provide a product page URL with --product-url or a search term with --search-term.")
-
-    parsed = parse_product_url(product_url)
-    if not parsed:
-        print(f"Invalid product URL format: {product_url}")
-        print("Example: https://www.sigmaaldrich.com/KR/ko/product/sigald/34873")
-        sys.exit(1)
-
-    country, default_language, brand, product_number = parsed
-    languages = normalize_languages(args.languages) or [default_language]
-
-    accept_language = f"{default_language}-{country},{default_language};q=0.9,en-US;q=0.8,en;q=0.7"
-    try:
-        client.prime_session(product_url, accept_language)
-    except RequestsError as exc:
-        print(f"Failed to fetch product page: {exc}")
-        sys.exit(1)
-
-    output_root = (REPO_ROOT / args.output_dir).resolve()
-    output_root.mkdir(parents=True, exist_ok=True)
-
-    print(f"Product number: {product_number}")
-    print(f"Brand: {brand}")
-    print(f"Country code: {country}")
-    print(f"Requested languages: {', '.join(languages)}")
+    args = parser.parse_args(argv)
 
-    records: List[DownloadRecord] = []
-    for language in languages:
-        sds_url = f"https://www.sigmaaldrich.com/{country}/{language}/sds/{brand}/{product_number}"
-        filename = f"{product_number}_{country}_{language.upper()}.pdf"
-        output_path = output_root / filename
+    if not args.search_term and not (args.product_url or args.legacy_product_url):
+        parser.error("Please provide a product page URL with --product-url or a search term with --search-term.")
 
-        print(f"\nAttempting SDS download ({language}): {sds_url}")
-        record = client.download_sds(
-            sds_url=sds_url,
-            output_path=output_path,
-            product_url=product_url,
-            country=country,
-            language=language,
-        )
-        if record:
-            records.append(record)
+    return args
 
-    summary = build_summary(
-        provider="aldrich",
-        product_identifier=product_number,
-        product_url=product_url,
-        downloads=records,
-        notes={"brand": brand, "country": country},
-    )
-    print_summary(summary)
 
-    sys.exit(0 if records else 1)
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; ``argv`` lets callers run it in-process."""
+    return asyncio.run(run(parse_args(argv)))
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
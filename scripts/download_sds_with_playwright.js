@@ -2,21 +2,14 @@
 const { request: playwrightRequest } = require('playwright');
 const fs = require('fs/promises');
 const path = require('path');
+const readline = require('readline');
 
-async function main() {
-  const [, , url, outputPath, referer = '', acceptLanguage = ''] = process.argv;
-
-  if (!url || !outputPath) {
-    console.error(
-      'Usage: node scripts/download_sds_with_playwright.js <url> <outputPath> [referer] [acceptLanguage]'
-    );
-    process.exit(1);
-  }
-
-  const context = await playwrightRequest.newContext({
-    ignoreHTTPSErrors: true,
-  });
+const USAGE = [
+  'Usage: node scripts/download_sds_with_playwright.js <url> <outputPath> [referer] [acceptLanguage]',
+  '       node scripts/download_sds_with_playwright.js --serve',
+].join('\n');
 
+async function downloadSds(context, { url, outputPath, referer = '', acceptLanguage = '' }) {
   const headers = {
     Accept: 'application/pdf,application/octet-stream;q=0.9,*/*;q=0.8',
   };
@@ -41,29 +34,94 @@ async function main() {
   const isPdf = contentType.toLowerCase().includes('pdf');
   const shouldSave = status === 200 && isPdf;
 
-  let body;
   if (shouldSave) {
-    body = await response.body();
+    const body = await response.body();
+    await fs.mkdir(path.dirname(outputPath), { recursive: true });
+    await fs.writeFile(outputPath, body);
+  } else {
+    await response.dispose();
+  }
+
+  return {
+    status,
+    headers: responseHeaders,
+    outputPath: path.resolve(outputPath),
+  };
+}
+
+function errorResult(error) {
+  return { error: error && error.message ? error.message : String(error) };
+}
+
+async function runJob(context, job) {
+  try {
+    if (!job || !job.url || !job.outputPath) {
+      throw new Error('Request requires "url" and "outputPath".');
+    }
+    return await downloadSds(context, job);
+  } catch (error) {
+    return errorResult(error);
+  }
+}
+
+// Long-running mode: one newline-delimited JSON message per line on stdin,
+// one JSON response line per message on stdout. The request context (and its
+// cookie jar and connections) is shared by every request of the process.
+//
+// A message is either a single job ({url, outputPath, referer, acceptLanguage})
+// answered with a single result, or a batch ({requests: [job, ...]}) whose jobs
+// are issued concurrently and answered with {results: [...]} in request order.
+async function serve() {
+  const context = await playwrightRequest.newContext({
+    ignoreHTTPSErrors: true,
+  });
+
+  const lines = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+  for await (const line of lines) {
+    if (!line.trim()) {
+      continue;
+    }
+
+    let result;
+    try {
+      const message = JSON.parse(line);
+      if (Array.isArray(message.requests)) {
+        const results = await Promise.all(message.requests.map((job) => runJob(context, job)));
+        result = { results };
+      } else {
+        result = await runJob(context, message);
+      }
+    } catch (error) {
+      result = errorResult(error);
+    }
+    process.stdout.write(`${JSON.stringify(result)}\n`);
   }
 
   await context.dispose();
+}
 
-  if (shouldSave && body) {
-    await fs.mkdir(path.dirname(outputPath), { recursive: true });
-    await fs.writeFile(outputPath, body);
+async function main() {
+  const [, , url, outputPath, referer = '', acceptLanguage = ''] = process.argv;
+
+  if (url === '--serve') {
+    await serve();
+    return;
   }
 
-  console.log(
-    JSON.stringify(
-      {
-        status,
-        headers: responseHeaders,
-        outputPath: path.resolve(outputPath),
-      },
-      null,
-      2
-    )
-  );
+  if (!url || !outputPath) {
+    console.error(USAGE);
+    process.exit(1);
+  }
+
+  const context = await playwrightRequest.newContext({
+    ignoreHTTPSErrors: true,
+  });
+
+  const result = await downloadSds(context, { url, outputPath, referer, acceptLanguage });
+
+  await context.dispose();
+
+  console.log(JSON.stringify(result, null, 2));
 }
 
 main().catch((error) => {
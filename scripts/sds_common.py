@@ -3,10 +3,59 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import os
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import (
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up
+    orjson = None
+
+# Browser fingerprint curl_cffi presents to the Akamai-fronted supplier sites.
+BROWSER_IMPERSONATE = "chrome120"
+
+# HTTP/2 over TLS (HTTP/1.1 for plain http): concurrent SDS requests to one host
+# are multiplexed over a single connection instead of opening one each.
+HTTP_VERSION = "v2tls"
+
+# Seconds curl keeps resolved host names (curl's default is 60).
+DNS_CACHE_TIMEOUT = 300
+
+# Request headers shared by the curl_cffi-based scrapers (Aldrich, TCI).
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/126.0.0.0 Safari/537.36"
+)
+
+HTML_ACCEPT = (
+    "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8"
+)
+
+# Upper bound on SDS documents fetched at the same time for one product.
+MAX_CONCURRENT_DOWNLOADS = 4
+
+# Buffer size for streamed PDF writes; curl hands over chunks of ~16 KiB, so a
+# large buffer coalesces them into a few big write() calls.
+WRITE_BUFFER_SIZE = 1 << 20
 
 
 @dataclass
@@ -27,10 +76,163 @@ class DownloadRecord:
         }
 
 
+def json_loads(data: Union[bytes, str]) -> object:
+    """Decode JSON with orjson when available, falling back to the stdlib."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(value: object, *, indent: bool = False) -> bytes:
+    """Encode JSON as UTF-8 bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(value, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+class JsonCache:
+    """Small on-disk cache storing one JSON file per key.
+
+    Entries older than ``expire_after`` seconds are treated as missing; pass
+    ``None`` to keep entries until they are overwritten.
+    """
+
+    def __init__(self, directory: Path, *, expire_after: Optional[float] = None) -> None:
+        self.directory = directory
+        self.expire_after = expire_after
+
+    def _path_for(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, key: str) -> Optional[object]:
+        path = self._path_for(key)
+        try:
+            if self.expire_after is not None:
+                if time.time() - path.stat().st_mtime > self.expire_after:
+                    return None
+            return json_loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: object) -> None:
+        """Store ``value`` under ``key``; a cache that cannot be written is skipped."""
+        path = self._path_for(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with atomic_write(path) as handle:
+                handle.write(json_dumps(value))
+        except OSError:
+            pass
+
+    def delete(self, key: str) -> None:
+        """Remove the entry for ``key``, if any; like ``set``, never raises."""
+        try:
+            self._path_for(key).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def temp_path_for(path: Path) -> Path:
+    """Return an unused ``.part`` path next to ``path``.
+
+    The random component keeps concurrent writers of the same ``path`` (other
+    threads, or coroutines sharing a thread) from sharing one temp file.
+    """
+    return path.with_name(f"{path.name}.{os.urandom(6).hex()}.part")
+
+
+@contextmanager
+def atomic_write(path: Path, *, drop_cache: bool = False) -> Iterator[BinaryIO]:
+    """Open a buffered binary handle whose contents replace ``path`` on success.
+
+    Bytes go to a unique ``.part`` file next to ``path`` as they are streamed in; if
+    the block raises (e.g. the connection drops mid-body) the partial file is
+    removed and any previous ``path`` is left untouched.
+
+    With ``drop_cache`` the finished file is synced and its pages are dropped
+    from the page cache (``POSIX_FADV_DONTNEED``), for bulk runs writing many
+    files that are never read back. Ignored where ``posix_fadvise`` is missing.
+    """
+    temp_path = temp_path_for(path)
+    try:
+        with temp_path.open("wb", buffering=WRITE_BUFFER_SIZE) as handle:
+            yield handle
+            if drop_cache and hasattr(os, "posix_fadvise"):
+                handle.flush()
+                # Dirty pages are not dropped; they must reach the disk first.
+                os.fdatasync(handle.fileno())
+                os.posix_fadvise(handle.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+async def stream_to_file(chunks: AsyncIterator[bytes], path: Path) -> int:
+    """Write an async stream of ``chunks`` to ``path`` with :func:`atomic_write`.
+
+    Chunks are collected up to ``WRITE_BUFFER_SIZE`` in memory; opening the
+    temp file, each write and the final ``os.replace`` run in a worker thread
+    so concurrent downloads never wait on the disk. Returns the number of
+    bytes written.
+    """
+    writer = atomic_write(path)
+    handle = await asyncio.to_thread(writer.__enter__)
+    size = 0
+    try:
+        pending: List[bytes] = []
+        pending_size = 0
+        async for chunk in chunks:
+            pending.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= WRITE_BUFFER_SIZE:
+                await asyncio.to_thread(handle.write, b"".join(pending))
+                size += pending_size
+                pending, pending_size = [], 0
+        if pending:
+            await asyncio.to_thread(handle.write, b"".join(pending))
+            size += pending_size
+    except BaseException as exc:
+        # Removes the temp file; the original error is re-raised below.
+        await asyncio.to_thread(writer.__exit__, type(exc), exc, exc.__traceback__)
+        raise
+    await asyncio.to_thread(writer.__exit__, None, None, None)
+    return size
+
+
 def normalize_languages(languages: Optional[Iterable[str]]) -> List[str]:
     if not languages:
         return []
-    return sorted({lang.strip().lower() for lang in languages if lang.strip()})
+    seen: Dict[str, None] = {}
+    for lang in languages:
+        normalized = lang.strip().lower()
+        if normalized:
+            seen[normalized] = None
+    # Callers usually pass zero or one language; only sort when it matters.
+    return sorted(seen) if len(seen) > 1 else list(seen)
+
+
+def parse_aldrich_product_url(product_url: str) -> Optional[Tuple[str, str, str, str]]:
+    """Split a Sigma-Aldrich product URL into (country, language, brand, product number).
+
+    Expects ``https://www.sigmaaldrich.com/{COUNTRY}/{lang}/product/{brand}/{number}``
+    and returns ``None`` for anything else.
+    """
+    parts = urlsplit(product_url)
+    if parts.scheme != "https" or parts.netloc != "www.sigmaaldrich.com":
+        return None
+    segments = parts.path.strip("/").split("/")
+    if len(segments) < 5 or segments[2] != "product":
+        return None
+    country, language, _, brand, product_number = segments[:5]
+    if not (len(country) == 2 and country.isascii() and country.isupper()):
+        return None
+    if not (len(language) == 2 and language.isascii() and language.islower()):
+        return None
+    if not brand or not product_number:
+        return None
+    return country, language, brand, product_number
 
 
 def build_summary(
@@ -59,4 +261,4 @@ def build_summary(
 def print_summary(summary: Dict[str, object]) -> None:
     """Emit a unified JSON summary to stdout."""
     print("\n=== SDS Download Summary ===")
-    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    print(json_dumps(summary, indent=True).decode("utf-8"))
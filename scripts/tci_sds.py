@@ -4,56 +4,127 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import codecs
 import re
+from contextlib import nullcontext
 from dataclasses import dataclass
-from html.parser import HTMLParser
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import urljoin, urlparse
+from typing import AsyncIterator, BinaryIO, Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import ParseResult, urljoin, urlparse
 
 from bs4 import BeautifulSoup
-from curl_cffi import requests
-from curl_cffi.requests import RequestsError
-
-from sds_common import DownloadRecord, build_summary, normalize_languages, print_summary
+from curl_cffi import CurlOpt
+from curl_cffi.requests import AsyncSession, RequestsError
+from lxml import etree
+
+from sds_common import (
+    BROWSER_IMPERSONATE,
+    DNS_CACHE_TIMEOUT,
+    HTML_ACCEPT,
+    HTTP_VERSION,
+    MAX_CONCURRENT_DOWNLOADS,
+    USER_AGENT,
+    DownloadRecord,
+    atomic_write,
+    build_summary,
+    normalize_languages,
+    print_summary,
+    stream_to_file,
+)
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 URL_DEFAULT = "https://www.tcichemicals.com/KR/ko/p/L0483"
 SEARCH_ENDPOINT_TEMPLATE = "https://www.tcichemicals.com/{country}/{language}/search"
 
-USER_AGENT = (
-    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-    "AppleWebKit/537.36 (KHTML, like Gecko) "
-    "Chrome/126.0.0.0 Safari/537.36"
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": HTML_ACCEPT,
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Connection": "keep-alive",
+    "Pragma": "no-cache",
+    "Cache-Control": "no-cache",
+}
+
+# Per-request headers of the SDS form POST that do not depend on the product.
+SDS_POST_HEADERS = {
+    "Accept": "*/*",
+    "X-Requested-With": "XMLHttpRequest",
+    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+}
+
+# Inline ``ACC.config.<key> = '<value>'`` assignments carrying the CSRF token
+# and the context path; both are read in a single scan of the page scripts.
+ACC_CONFIG_RE = re.compile(
+    r"ACC\.config\.(CSRFToken|encodedContextPath)\s*=\s*'([^']+)'", re.ASCII
+)
+ACC_CONFIG_KEY_COUNT = 2
+# Start tags SDSMetadataTarget reacts to; every other tag is ignored up front.
+METADATA_START_TAGS = frozenset({"input", "select", "option", "script"})
+
+# Media types (Content-Type without parameters) accepted as an SDS document.
+PDF_MEDIA_TYPES = frozenset(
+    {
+        "application/pdf",
+        "application/x-pdf",
+        "application/octet-stream",
+        "binary/octet-stream",
+    }
 )
 
-HTML_ACCEPT = (
-    "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8"
+CONTENT_DISPOSITION_FILENAME_RE = re.compile(
+    r'filename[^;=\n]*=((["\']).*?\2|[^;\n]*)', re.ASCII
 )
 
 
 class TciClient:
-    """A client for downloading SDSs from TCI."""
-
-    def __init__(self) -> None:
-        self.session = requests.Session(impersonate="chrome120")
-        self.session.headers.update(
-            {
-                "User-Agent": USER_AGENT,
-                "Accept": HTML_ACCEPT,
-                "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-                "Connection": "keep-alive",
-                "Pragma": "no-cache",
-                "Cache-Control": "no-cache",
-            }
+    """A client for downloading SDSs from TCI.
+
+    Pass ``session`` to share one connection pool (and its TLS sessions) across
+    several clients, e.g. from a batch runner; a shared session is left open on
+    exit and stays owned by the caller. Its headers are kept as they are; only
+    the ``DEFAULT_HEADERS`` it does not set yet are added.
+    """
+
+    def __init__(self, session: Optional[AsyncSession] = None) -> None:
+        self._owns_session = session is None
+        self.session = session or AsyncSession(
+            impersonate=BROWSER_IMPERSONATE,
+            http_version=HTTP_VERSION,
+            curl_options={CurlOpt.DNS_CACHE_TIMEOUT: DNS_CACHE_TIMEOUT},
         )
+        # Accept-Encoding is negotiated by curl_cffi itself (gzip/deflate/br/zstd).
+        for name, value in DEFAULT_HEADERS.items():
+            self.session.headers.setdefault(name, value)
+        self._download_slots = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+
+    async def __aenter__(self) -> "TciClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._owns_session:
+            await self.session.close()
+
+    async def fetch_product_page(
+        self, url: str, output_path: Optional[Path]
+    ) -> Tuple[int, Optional[SDSMetadata]]:
+        """Stream the product page to ``output_path`` while parsing its SDS metadata.
+
+        Each chunk is written to disk and fed to the lxml parser as it arrives,
+        so the page is never held in memory as a whole; with ``output_path=None``
+        the page is only parsed. Returns the number of bytes received and the
+        parsed metadata (``None`` if the page has no SDS form).
+        """
+        async with self.session.stream("GET", url, timeout=60) as response:
+            response.raise_for_status()
+            with atomic_write(output_path) if output_path else nullcontext() as handle:
+                return await parse_sds_page(
+                    response.aiter_content(),
+                    charset=response.charset_encoding,
+                    handle=handle,
+                )
 
-    def fetch_product_page(self, url: str) -> str:
-        response = self.session.get(url, timeout=60)
-        response.raise_for_status()
-        return response.text
-
-    def resolve_product_url_from_search(
+    async def resolve_product_url_from_search(
         self, term: str, country: str, language: str
     ) -> Optional[str]:
         if not term.strip():
@@ -61,7 +132,7 @@ class TciClient:
 
         search_url = f"https://www.tcichemicals.com/{country}/{language}/search/"
         params = {"text": term, "sort": "productNameExactMatch"}
-        response = self.session.get(search_url, params=params, timeout=60)
+        response = await self.session.get(search_url, params=params, timeout=60)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.content, "lxml")
@@ -71,102 +142,138 @@ class TciClient:
             return None
 
         path = product_link["href"]
+        # Site-relative hrefs are the norm; anything else goes through urljoin.
+        if path.startswith("/") and not path.startswith("//"):
+            return "https://www.tcichemicals.com" + path
         return urljoin("https://www.tcichemicals.com", path)
 
-    def download_sds_documents(
+    async def download_sds_documents(
         self,
-        product_url: str,
+        product: ParseResult,
         metadata: SDSMetadata,
         languages: List[str],
         output_dir: Path,
-        csrf_token: Optional[str],
     ) -> List[DownloadRecord]:
-        parsed_url = urlparse(product_url)
-        base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        product_url = product.geturl()
+        base_url = f"{product.scheme}://{product.netloc}"
         endpoint_path = (
             f"{metadata.context_path.rstrip('/')}/documentSearch/productSDSSearchDoc"
         )
-        sds_url = urljoin(base_url, endpoint_path)
+        # base_url has no path, so an absolute endpoint path can be appended as is.
+        if endpoint_path.startswith("/"):
+            sds_url = base_url + endpoint_path
+        else:
+            sds_url = urljoin(base_url, endpoint_path)
+        # Built once and shared by every language's request.
+        post_headers = {**SDS_POST_HEADERS, "Referer": product_url, "Origin": base_url}
 
         output_dir.mkdir(parents=True, exist_ok=True)
-        available_languages: Dict[str, str] = {
-            code: label for code, label in metadata.languages if code
-        }
+        available_codes: FrozenSet[str] = frozenset(
+            code for code, _ in metadata.languages if code
+        )
 
-        records: List[DownloadRecord] = []
-        for requested_lang in languages:
-            lang = requested_lang.strip()
-            if not lang:
-                continue
-            if available_languages and lang not in available_languages:
+        # Order-preserving dedup: a repeated language would repeat the POST
+        # and overwrite the same file.
+        unique_languages = dict.fromkeys(lang.strip() for lang in languages)
+        unique_languages.pop("", None)
+
+        targets: List[str] = []
+        downloads = []
+        for lang in unique_languages:
+            if available_codes and lang not in available_codes:
                 print(
                     f"- Skipping '{lang}': not listed as an available language on the page."
                 )
                 continue
-
-            data = {
-                "productCode": metadata.product_code.upper(),
-                "langSelector": lang,
-                "selectedCountry": metadata.selected_country,
-            }
-            if csrf_token:
-                data["CSRFToken"] = csrf_token
-
-            try:
-                response = self.session.post(
+            targets.append(lang)
+            downloads.append(
+                self._download_sds_document(
                     sds_url,
-                    data=data,
-                    timeout=60,
-                    headers={
-                        "Referer": product_url,
-                        "Origin": base_url,
-                        "Accept": "*/*",
-                        "X-Requested-With": "XMLHttpRequest",
-                        "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-                    },
+                    headers=post_headers,
+                    metadata=metadata,
+                    lang=lang,
+                    output_dir=output_dir,
                 )
-            except RequestsError as exc:
-                print(f"- SDS download failed ({lang}): {exc}")
-                continue
+            )
 
-            if response.status_code != 200:
-                print(f"- SDS download failed ({lang}): HTTP {response.status_code}")
-                continue
+        # One language failing unexpectedly must not discard the others.
+        results = await asyncio.gather(*downloads, return_exceptions=True)
+        records: List[DownloadRecord] = []
+        for lang, result in zip(targets, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    # Cancellation (or an interrupt) is not a per-language failure.
+                    raise result
+                print(f"- SDS download failed ({lang}): {result}")
+            elif result:
+                records.append(result)
+        return records
 
-            content_type = response.headers.get("Content-Type", "")
-            if "pdf" not in content_type.lower() and "octet-stream" not in content_type.lower():
-                response_text = (
-                    response.headers.get("response-text") or response.text[:200]
-                )
-                print(f"- SDS download failed ({lang}): {response_text}")
-                continue
+    async def _download_sds_document(
+        self,
+        sds_url: str,
+        *,
+        headers: Dict[str, str],
+        metadata: SDSMetadata,
+        lang: str,
+        output_dir: Path,
+    ) -> Optional[DownloadRecord]:
+        data = {
+            "productCode": metadata.product_code.upper(),
+            "langSelector": lang,
+            "selectedCountry": metadata.selected_country,
+        }
+        if metadata.csrf_token:
+            data["CSRFToken"] = metadata.csrf_token
+
+        try:
+            async with self._download_slots, self.session.stream(
+                "POST",
+                sds_url,
+                data=data,
+                timeout=60,
+                headers=headers,
+            ) as response:
+                if response.status_code != 200:
+                    print(f"- SDS download failed ({lang}): HTTP {response.status_code}")
+                    return None
+
+                # Decide from the headers alone; a rejected body is never read.
+                content_type = response.headers.get("Content-Type", "")
+                media_type = content_type.partition(";")[0].strip().lower()
+                if media_type not in PDF_MEDIA_TYPES:
+                    response_text = response.headers.get("response-text") or (
+                        f"unexpected content-type '{content_type}'"
+                    )
+                    print(f"- SDS download failed ({lang}): {response_text}")
+                    return None
+
+                filename = None
+                disposition = response.headers.get("Content-Disposition", "")
+                if disposition:
+                    match = CONTENT_DISPOSITION_FILENAME_RE.search(disposition)
+                    if match:
+                        filename = match.group(1).strip("\"'")
+                if not filename:
+                    filename = f"{metadata.product_code}_{lang}.pdf"
+
+                output_path = output_dir / filename
+                size = await stream_to_file(response.aiter_content(), output_path)
+        except RequestsError as exc:
+            print(f"- SDS download failed ({lang}): {exc}")
+            return None
 
-            filename = None
-            disposition = response.headers.get("Content-Disposition", "")
-            if disposition:
-                match = re.search(r'filename[^;=\n]*=((["\']).*?\2|[^;\n]*)', disposition)
-                if match:
-                    filename = match.group(1).strip("\"'")
-            if not filename:
-                filename = f"{metadata.product_code}_{lang}.pdf"
-
-            output_path = output_dir / filename
-            output_path.write_bytes(response.content)
-            print(f"- SDS saved ({lang}): {output_path}")
-
-            records.append(
-                DownloadRecord(
-                    path=output_path,
-                    languages=normalize_languages([lang]),
-                    source_url=sds_url,
-                    metadata={
-                        "productCode": metadata.product_code,
-                        "country": metadata.selected_country,
-                    },
-                )
-            )
+        print(f"- SDS saved ({lang}, {size / 1024:.1f} KB): {output_path}")
 
-        return records
+        return DownloadRecord(
+            path=output_path,
+            languages=normalize_languages([lang]),
+            source_url=sds_url,
+            metadata={
+                "productCode": metadata.product_code,
+                "country": metadata.selected_country,
+            },
+        )
 
 
 @dataclass
@@ -175,71 +282,222 @@ class SDSMetadata:
     selected_country: str
     languages: List[Tuple[str, str]]
     context_path: str
+    csrf_token: Optional[str] = None
+
+
+def split_partial_tag(data: bytes) -> Tuple[bytes, bytes]:
+    """Split ``data`` into the bytes to feed now and an unterminated trailing tag.
 
+    libxml2's HTML push parser misses a ``</script>`` or ``</style>`` end tag
+    that is split across two ``feed()`` calls and keeps reading the rest of the
+    page as script text, so a trailing ``<...`` without its ``>`` is held back
+    and prepended to the next chunk.
+    """
+    start = data.rfind(b"<")
+    if start == -1 or data.find(b">", start) != -1:
+        return data, b""
+    return data[:start], data[start:]
+
+
+class SDSMetadataTarget:
+    """lxml parser target collecting SDS metadata while libxml2 tokenizes the page.
+
+    No element tree is built; ``close()`` returns the populated
+    :class:`SDSMetadata`, or ``None`` when the page has no SDS form.
+    """
 
-class SDSMetadataParser(HTMLParser):
     def __init__(self) -> None:
-        super().__init__()
-        self.product_code: Optional[str] = None
-        self.selected_country: Optional[str] = None
-        self.context_path: str = "/"
+        self.product_code = ""
+        self.selected_country = ""
         self.languages: List[Tuple[str, str]] = []
         self._in_lang_selector = False
         self._current_value: Optional[str] = None
         self._current_label: List[str] = []
+        self._config: Dict[str, str] = {}
+        self._in_script = False
+        self._script_chunks: List[str] = []
 
-    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
-        attrs_dict = dict(attrs)
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        if tag not in METADATA_START_TAGS:
+            return
         if tag == "input":
-            element_id = attrs_dict.get("id")
-            value = (attrs_dict.get("value") or "").strip()
-            if element_id == "sdsProductCode":
-                self.product_code = value
-            elif element_id == "selectedCountry":
-                self.selected_country = value
-        elif tag == "select" and attrs_dict.get("id") == "langSelector":
+            element_id = attrib.get("id")
+            if element_id == "sdsProductCode" and not self.product_code:
+                self.product_code = (attrib.get("value") or "").strip()
+            elif element_id == "selectedCountry" and not self.selected_country:
+                self.selected_country = (attrib.get("value") or "").strip()
+        elif tag == "select" and attrib.get("id") == "langSelector":
             self._in_lang_selector = True
-        elif self._in_lang_selector and tag == "option":
-            self._current_value = (attrs_dict.get("value") or "").strip()
+        elif tag == "option" and self._in_lang_selector:
+            self._current_value = (attrib.get("value") or "").strip()
             self._current_label = []
+        elif tag == "script" and len(self._config) < ACC_CONFIG_KEY_COUNT:
+            self._in_script = True
+            self._script_chunks = []
 
-    def handle_endtag(self, tag: str) -> None:
-        if tag == "select" and self._in_lang_selector:
+    def end(self, tag: str) -> None:
+        if tag == "select":
             self._in_lang_selector = False
-        elif tag == "option" and self._in_lang_selector and self._current_value:
-            label = "".join(self._current_label).strip()
-            self.languages.append((self._current_value, label))
+        elif tag == "option" and self._current_value is not None:
+            if self._current_value:
+                label = "".join(self._current_label).strip()
+                self.languages.append((self._current_value, label))
             self._current_value = None
-            self._current_label = []
-
-    def handle_data(self, data: str) -> None:
-        if self._in_lang_selector and self._current_value is not None:
+        elif tag == "script" and self._in_script:
+            self._in_script = False
+            script_text = "".join(self._script_chunks)
+            if "ACC.config" in script_text:
+                for match in ACC_CONFIG_RE.finditer(script_text):
+                    self._config.setdefault(match.group(1), match.group(2))
+            self._script_chunks = []
+
+    def data(self, data: str) -> None:
+        if self._in_script:
+            self._script_chunks.append(data)
+        elif self._current_value is not None:
             self._current_label.append(data)
 
+    def close(self) -> Optional[SDSMetadata]:
+        if not self.product_code or not self.selected_country:
+            return None
 
-def extract_csrf_token(html: str) -> Optional[str]:
-    match = re.search(r"ACC\.config\.CSRFToken\s*=\s*'([^']+)'", html)
-    return match.group(1) if match else None
+        config = self._config
+        context_path = config.get("encodedContextPath", "").replace("\\/", "/") or "/"
 
+        return SDSMetadata(
+            product_code=self.product_code,
+            selected_country=self.selected_country,
+            languages=self.languages,
+            context_path=context_path,
+            csrf_token=config.get("CSRFToken"),
+        )
 
-def parse_sds_metadata(html: str) -> Optional[SDSMetadata]:
-    parser = SDSMetadataParser()
-    parser.feed(html)
 
-    if not parser.product_code or not parser.selected_country:
-        return None
+def sds_page_parser(charset: Optional[str]) -> etree.HTMLParser:
+    """Return an HTML parser feeding a fresh :class:`SDSMetadataTarget`.
 
-    context_match = re.search(r"ACC\.config\.encodedContextPath\s*=\s*'([^']+)'", html)
-    context_path = "/"
-    if context_match:
-        context_path = context_match.group(1).replace("\\/", "/") or "/"
+    Same default as ``Response.text``: the header charset when it is known,
+    else UTF-8. The name is canonicalised first because libxml2 does not know
+    every Python alias (e.g. ``latin_1``).
+    """
+    encoding = "utf-8"
+    if charset:
+        try:
+            encoding = codecs.lookup(charset).name
+        except LookupError:
+            pass
+    try:
+        return etree.HTMLParser(target=SDSMetadataTarget(), encoding=encoding)
+    except LookupError:
+        return etree.HTMLParser(target=SDSMetadataTarget(), encoding="utf-8")
+
+
+async def parse_sds_page(
+    chunks: AsyncIterator[bytes],
+    *,
+    charset: Optional[str] = None,
+    handle: Optional[BinaryIO] = None,
+) -> Tuple[int, Optional[SDSMetadata]]:
+    """Parse the SDS metadata of a product page streamed as ``chunks``.
+
+    Each chunk is copied to ``handle`` (if given) and fed to the parser as it
+    arrives, holding back a split trailing tag (see :func:`split_partial_tag`).
+    Returns the number of bytes received and the metadata, ``None`` if the page
+    has no SDS form or no document at all (e.g. an empty body).
+    """
+    parser = sds_page_parser(charset)
+    size = 0
+    pending = b""
+    async for chunk in chunks:
+        if handle is not None:
+            handle.write(chunk)
+        size += len(chunk)
+        data, pending = split_partial_tag(pending + chunk)
+        if data:
+            parser.feed(data)
+    try:
+        if pending:
+            parser.feed(pending)
+        return size, parser.close()
+    except etree.LxmlError:
+        return size, None
+
+
+async def run(args: argparse.Namespace) -> int:
+    async with TciClient() as client:
+        product_url = args.product_url
+        if args.search_term:
+            segments = [segment for segment in urlparse(product_url).path.split("/") if segment]
+            country = segments[0] if len(segments) >= 1 else "KR"
+            language = segments[1] if len(segments) >= 2 else "ko"
+            resolved = await client.resolve_product_url_from_search(
+                term=args.search_term,
+                country=country,
+                language=language,
+            )
+            if not resolved:
+                print(f"No TCI product found for search term '{args.search_term}'.")
+                return 1
+            print(f"Resolved search term '{args.search_term}' to: {resolved}")
+            product_url = resolved
+
+        # Parsed once; the product code fallback and the SDS requests reuse it.
+        parsed_product = urlparse(product_url)
+
+        html_output_path: Optional[Path] = None
+        if args.html_output and args.html_output != "-":
+            html_output_path = (REPO_ROOT / args.html_output).resolve()
+        try:
+            html_size, metadata = await client.fetch_product_page(
+                product_url, html_output_path
+            )
+        except RequestsError as exc:
+            print(f"Failed to fetch product page: {exc}")
+            return 1
+        if html_output_path:
+            print(f"HTML saved ({html_size} bytes): {html_output_path}")
+
+        product_code = (
+            metadata.product_code
+            if metadata
+            else parsed_product.path.rstrip("/").rpartition("/")[2]
+        )
 
-    return SDSMetadata(
-        product_code=parser.product_code,
-        selected_country=parser.selected_country,
-        languages=parser.languages,
-        context_path=context_path,
+        records: List[DownloadRecord] = []
+        if args.download_sds:
+            if not metadata:
+                print("SDS metadata not found in the HTML; cannot download SDS.")
+            else:
+                if not metadata.csrf_token:
+                    print("Warning: CSRF token not found; SDS download may fail.")
+
+                requested_languages = normalize_languages(args.languages) or [
+                    code for code, _ in metadata.languages if code
+                ]
+                if not requested_languages:
+                    print("No languages requested; skipping SDS download.")
+                else:
+                    sds_output_dir = (REPO_ROOT / args.sds_output_dir).resolve()
+                    records = await client.download_sds_documents(
+                        parsed_product,
+                        metadata,
+                        requested_languages,
+                        sds_output_dir,
+                    )
+                    if not records:
+                        print("No SDS files were downloaded.")
+
+    summary = build_summary(
+        provider="tci",
+        product_identifier=product_code,
+        product_url=product_url,
+        html_path=html_output_path,
+        downloads=records,
+        notes={"userAgent": USER_AGENT},
     )
+    print_summary(summary)
+
+    return 0
 
 
 def main() -> None:
@@ -256,7 +514,7 @@ def main() -> None:
         "--output",
         dest="html_output",
         default="tci_product.html",
-        help="Path for saving the fetched HTML (optional).",
+        help="Path for saving the fetched HTML; pass '-' or an empty value to skip saving.",
     )
     parser.add_argument(
         "--download-sds",
@@ -285,76 +543,7 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    product_url = args.product_url
-    client = TciClient()
-    if args.search_term:
-        parsed = urlparse(product_url)
-        segments = [segment for segment in parsed.path.split("/") if segment]
-        country = segments[0] if len(segments) >= 1 else "KR"
-        language = segments[1] if len(segments) >= 2 else "ko"
-        resolved = client.resolve_product_url_from_search(
-            term=args.search_term,
-            country=country,
-            language=language,
-        )
-        if not resolved:
-            print(f"No TCI product found for search term '{args.search_term}'.")
-            raise SystemExit(1)
-        print(f"Resolved search term '{args.search_term}' to: {resolved}")
-        product_url = resolved
-
-    try:
-        html = client.fetch_product_page(product_url)
-    except RequestsError as exc:
-        print(f"Failed to fetch product page: {exc}")
-        raise SystemExit(1) from exc
-
-    html_output_path = (REPO_ROOT / args.html_output).resolve()
-    html_output_path.write_text(html, encoding="utf-8")
-    print(f"HTML saved ({len(html)} bytes): {html_output_path}")
-
-    metadata = parse_sds_metadata(html)
-    product_code = (
-        metadata.product_code
-        if metadata
-        else urlparse(product_url).path.rstrip("/").split("/")[-1]
-    )
-
-    records: List[DownloadRecord] = []
-    if args.download_sds:
-        if not metadata:
-            print("SDS metadata not found in the HTML; cannot download SDS.")
-        else:
-            csrf_token = extract_csrf_token(html)
-            if not csrf_token:
-                print("Warning: CSRF token not found; SDS download may fail.")
-
-            requested_languages = normalize_languages(args.languages) or [
-                code for code, _ in metadata.languages if code
-            ]
-            if not requested_languages:
-                print("No languages requested; skipping SDS download.")
-            else:
-                sds_output_dir = (REPO_ROOT / args.sds_output_dir).resolve()
-                records = client.download_sds_documents(
-                    product_url,
-                    metadata,
-                    requested_languages,
-                    sds_output_dir,
-                    csrf_token,
-                )
-                if not records:
-                    print("No SDS files were downloaded.")
-
-    summary = build_summary(
-        provider="tci",
-        product_identifier=product_code,
-        product_url=product_url,
-        html_path=html_output_path,
-        downloads=records,
-        notes={"userAgent": USER_AGENT},
-    )
-    print_summary(summary)
+    raise SystemExit(asyncio.run(run(args)))
 
 
 if __name__ == "__main__":
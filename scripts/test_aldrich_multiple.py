@@ -1,13 +1,23 @@
 #!/usr/bin/env python3
 """Batch test runner for the Sigma-Aldrich SDS downloader."""
 
-import subprocess
+import asyncio
+import io
 import sys
-from pathlib import Path
-from typing import List, Tuple
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from typing import List, Optional, Tuple
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
-DOWNLOADER = REPO_ROOT / "scripts" / "aldrich_mcp.py"
+import aldrich_sds
+
+# Worker processes running the downloader at the same time; kept low to stay
+# clear of rate limits. Each worker is reused for several products.
+MAX_WORKERS = 5
+DOWNLOAD_TIMEOUT = 180
+# asyncio.wait_for only fires at await points; a worker blocked outside one is
+# killed once its product has been waited on for this long.
+HARD_TIMEOUT = DOWNLOAD_TIMEOUT + 60
 
 # (URL, Description)
 TEST_PRODUCTS: List[Tuple[str, str]] = [
@@ -24,56 +34,117 @@ TEST_PRODUCTS: List[Tuple[str, str]] = [
 ]
 
 
-def run_downloader(url: str, description: str) -> Tuple[bool, str]:
-    print("\n" + "=" * 80)
-    print(f"Product: {description}")
-    print(f"URL: {url}")
-    print("-" * 80)
-
-    command = [
-        sys.executable,
-        str(DOWNLOADER.relative_to(REPO_ROOT)),
-        "--product-url",
-        url,
-        "-l",
-        "ko",
-        "en",
+def log_header(url: str, description: str) -> List[bytes]:
+    return [
+        b"\n" + b"=" * 80,
+        f"Product: {description}".encode("utf-8"),
+        f"URL: {url}".encode("utf-8"),
+        b"-" * 80,
     ]
 
-    try:
-        result = subprocess.run(
-            command,
-            cwd=REPO_ROOT,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            timeout=180,
-        )
-    except subprocess.TimeoutExpired:
-        print("  Timeout: downloader exceeded 180 seconds.")
-        return False, "timeout"
-
-    if result.stdout:
-        print(result.stdout.strip())
-    if result.stderr:
-        print("---- stderr ----")
-        print(result.stderr.strip())
-
-    success = result.returncode == 0
+
+def run_downloader(url: str, description: str) -> Tuple[bool, str, bytes]:
+    """Run the downloader for one product and return (success, status, log).
+
+    Runs aldrich_sds in this (worker) process, so the interpreter and its
+    imports are paid for once per worker rather than once per product. The
+    downloader's output is captured as UTF-8 bytes.
+    """
+    log = log_header(url, description)
+
+    argv = ["--product-url", url, "-l", "ko", "en"]
+
+    out = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", write_through=True)
+    err = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", write_through=True)
+    returncode = 1
+    timed_out = False
+    with redirect_stdout(out), redirect_stderr(err):
+        try:
+            args = aldrich_sds.parse_args(argv)
+            returncode = asyncio.run(asyncio.wait_for(aldrich_sds.run(args), DOWNLOAD_TIMEOUT))
+        except asyncio.TimeoutError:
+            timed_out = True
+        except SystemExit as exc:
+            # argparse errors exit with status 2.
+            returncode = exc.code if isinstance(exc.code, int) else 1
+        except Exception:
+            traceback.print_exc()
+    captured_out = out.buffer.getvalue()
+    captured_err = err.buffer.getvalue()
+
+    if timed_out:
+        log.append(f"  Timeout: downloader exceeded {DOWNLOAD_TIMEOUT} seconds.".encode("utf-8"))
+        return False, "timeout", b"\n".join(log)
+
+    if captured_out:
+        log.append(captured_out.rstrip())
+    if captured_err:
+        log.append(b"---- stderr ----")
+        log.append(captured_err.rstrip())
+
+    success = returncode == 0
     status = "success" if success else "failed"
-    return success, status
+    return success, status, b"\n".join(log)
 
 
-def main() -> None:
-    if not DOWNLOADER.exists():
-        print(f"Downloader not found: {DOWNLOADER}")
-        sys.exit(1)
+def terminate_pool(pool: ProcessPoolExecutor) -> None:
+    """Kill the pool's worker processes, including one stuck in a blocking call."""
+    # ProcessPoolExecutor has no public way to stop a running task.
+    for process in list(pool._processes.values()):
+        process.terminate()
+    pool.shutdown(wait=True, cancel_futures=True)
 
-    results: List[Tuple[str, str, bool, str]] = []
 
-    for url, description in TEST_PRODUCTS:
-        success, status = run_downloader(url, description)
+def main() -> None:
+    total = len(TEST_PRODUCTS)
+    outcomes: List[Optional[Tuple[bool, str, bytes]]] = [None] * total
+    completed = 0
+
+    def record(index: int, outcome: Tuple[bool, str, bytes]) -> None:
+        nonlocal completed
+        completed += 1
+        outcomes[index] = outcome
+        print(f"[{completed}/{total}] {TEST_PRODUCTS[index][1]}: {outcome[1]}")
+
+    # Processes rather than threads: each run redirects sys.stdout and owns an
+    # event loop, which would clash between threads of one interpreter. When a
+    # product exceeds HARD_TIMEOUT the pool is killed and the products that
+    # had not finished are run again in a fresh pool.
+    remaining = list(range(total))
+    while remaining:
+        pool = ProcessPoolExecutor(max_workers=min(MAX_WORKERS, len(remaining)))
+        futures = [
+            (index, pool.submit(run_downloader, *TEST_PRODUCTS[index])) for index in remaining
+        ]
+        remaining = []
+        for position, (index, future) in enumerate(futures):
+            try:
+                outcome = future.result(timeout=HARD_TIMEOUT)
+            except TimeoutError:
+                log = log_header(*TEST_PRODUCTS[index])
+                log.append(
+                    f"  Timeout: worker still busy after {HARD_TIMEOUT} seconds; "
+                    "terminated.".encode("utf-8")
+                )
+                record(index, (False, "timeout", b"\n".join(log)))
+                for other_index, other in futures[position + 1 :]:
+                    if other.done():
+                        record(other_index, other.result())
+                    else:
+                        remaining.append(other_index)
+                terminate_pool(pool)
+                break
+            record(index, outcome)
+        else:
+            pool.shutdown()
+
+    # Logs are buffered and replayed in TEST_PRODUCTS order, so the report reads
+    # the same regardless of which product finished first. Pending text is
+    # flushed before each raw write to keep the byte stream in order.
+    results: List[Tuple[str, str, bool, str]] = []
+    for (url, description), (success, status, log) in zip(TEST_PRODUCTS, outcomes):
+        sys.stdout.flush()
+        sys.stdout.buffer.write(log + b"\n")
         results.append((url, description, success, status))
 
     print("\n" + "=" * 80)
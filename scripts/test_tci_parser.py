@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Regression checks for the streamed TCI product page parser.
+
+The page arrives in network-sized chunks; the parsed metadata must not depend
+on where those chunk boundaries fall (e.g. inside a ``</script>`` end tag).
+"""
+
+import asyncio
+import sys
+from typing import AsyncIterator, List, Optional
+
+from tci_sds import SDSMetadata, parse_sds_page
+
+PAGE = (
+    b"<html><head>"
+    b"<script>ACC.config.encodedContextPath = '\\/KR\\/ko';"
+    b" ACC.config.CSRFToken = 'token-123';</script>"
+    b"<style>p { color: red; }</style>"
+    b"</head><body>"
+    b'<script>var markup = "<b>bold</b>";</script>'
+    b'<input type="hidden" id="sdsProductCode" value="L0483">'
+    b'<input type="hidden" id="selectedCountry" value="KR">'
+    b'<select id="langSelector">'
+    b'<option value="ko">Korean</option><option value="en">English</option>'
+    b"</select>"
+    b"<script>window.loaded = true;</script>"
+    b"</body></html>"
+)
+
+
+async def iter_chunks(chunks: List[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+def parse_chunks(
+    chunks: List[bytes], charset: Optional[str] = None
+) -> Optional[SDSMetadata]:
+    """Run ``chunks`` through the parser used by ``TciClient.fetch_product_page``."""
+    size, metadata = asyncio.run(parse_sds_page(iter_chunks(chunks), charset=charset))
+    assert size == sum(len(chunk) for chunk in chunks)
+    return metadata
+
+
+def test_metadata_from_single_chunk() -> None:
+    metadata = parse_chunks([PAGE])
+    assert metadata is not None
+    assert metadata.product_code == "L0483"
+    assert metadata.selected_country == "KR"
+    assert metadata.languages == [("ko", "Korean"), ("en", "English")]
+    assert metadata.context_path == "/KR/ko"
+    assert metadata.csrf_token == "token-123"
+
+
+def test_metadata_independent_of_chunk_boundaries() -> None:
+    expected = parse_chunks([PAGE])
+    for offset in range(1, len(PAGE)):
+        assert parse_chunks([PAGE[:offset], PAGE[offset:]]) == expected, offset
+    assert parse_chunks([PAGE[i : i + 1] for i in range(len(PAGE))]) == expected
+
+
+def test_empty_body_and_unknown_charset() -> None:
+    assert parse_chunks([]) is None
+    assert parse_chunks([b""]) is None
+    assert parse_chunks([PAGE], charset="x-unknown") == parse_chunks([PAGE])
+    assert parse_chunks([PAGE], charset="latin_1") == parse_chunks([PAGE])
+
+
+if __name__ == "__main__":
+    test_metadata_from_single_chunk()
+    test_metadata_independent_of_chunk_boundaries()
+    test_empty_body_and_unknown_charset()
+    print("OK")
+    sys.exit(0)
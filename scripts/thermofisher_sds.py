@@ -4,16 +4,34 @@
 from __future__ import annotations
 
 import argparse
-import uuid
+import os
+import re
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from urllib.parse import quote_plus, urlparse
 
 import requests
-
-from sds_common import DownloadRecord, build_summary, normalize_languages, print_summary
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from sds_common import (
+    DownloadRecord,
+    JsonCache,
+    atomic_write,
+    build_summary,
+    json_dumps,
+    json_loads,
+    normalize_languages,
+    print_summary,
+    temp_path_for,
+)
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
+# PDF validators (ETag / Last-Modified) for conditional re-downloads.
+CACHE_DIR = REPO_ROOT / ".cache" / "thermofisher"
 BASE_HOST = "https://chemicals.thermofisher.kr"
 APAC_BASE = f"{BASE_HOST}/apac"
 CATEGORY_ENDPOINT = f"{APAC_BASE}/api/search/category"
@@ -27,24 +45,91 @@ USER_AGENT = (
     "Chrome/124.0.0.0 Safari/537.36"
 )
 
+# "/<keyword>/<value>" in product and category URLs; the value stops at the
+# next path separator, query or fragment.
+URL_SEGMENT_RES = {
+    keyword: re.compile(rf"/{keyword}/([^/?#]+)", re.ASCII)
+    for keyword in ("product", "category")
+}
+
+# Bytes requested from urllib3 per read while streaming a PDF to disk.
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Products processed at the same time, each fetching up to LANGUAGE_WORKERS
+# languages in parallel; the connection pool is sized for MAX_WORKERS x
+# LANGUAGE_WORKERS so concurrent workers do not wait for (or discard) pooled
+# connections, however many languages are requested.
+MAX_WORKERS = 8
+LANGUAGE_WORKERS = 2
+POOL_MAXSIZE = MAX_WORKERS * LANGUAGE_WORKERS
+
+# Transient failures (throttling, gateway errors, dropped connections) are
+# retried on the same pooled connection instead of failing the product. The
+# API's POSTs are read-only searches, so they are safe to repeat.
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "POST"}),
+    # Hand the last response back so raise_for_status reports it as before.
+    raise_on_status=False,
+)
+
 
 class ThermoFisherClient:
     """Minimal client for Thermo Fisher APAC APIs."""
 
-    def __init__(self, country: str = "kr") -> None:
+    def __init__(self, country: str = "kr", cache: Optional[JsonCache] = None) -> None:
         self.country = country
+        self.cache = cache
         self.session = requests.Session()
         self.session.headers.update(
             {
                 "User-Agent": USER_AGENT,
-                "Accept-Encoding": "gzip, deflate, br",
                 "Connection": "keep-alive",
             }
         )
+        adapter = HTTPAdapter(
+            pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE, max_retries=RETRY
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Per-request headers that are the same for every call of this client.
+        self._base_headers: Dict[str, str] = {"Origin": BASE_HOST, "country": country}
+        # Request body skeletons; each call copies one and fills in its fields.
+        # The key order is kept; whitespace is not (orjson emits compact JSON).
+        self._category_payload: Dict[str, object] = {
+            "categoryId": None,
+            "pageNo": None,
+            "pageSize": None,
+            "filter": "",
+            "countryCode": country,
+            "language": None,
+        }
+        self._search_payload: Dict[str, object] = {
+            "countryCode": country,
+            "language": None,
+            "filter": "",
+            "pageNo": None,
+            "pageSize": None,
+            "persona": "",
+            "query": None,
+        }
         self._prefetched: set[str] = set()
+        # API lookups are stable for the duration of a run; memoized so a
+        # product reached twice (or retried) does not repeat them.
+        self._child_sku_cache: Dict[str, List[str]] = {}
+        self._sds_url_cache: Dict[Tuple[Tuple[str, ...], str], str] = {}
 
     def _random_dye(self) -> str:
-        return str(uuid.uuid4())
+        # Same shape as str(uuid.uuid4()) (version 4, RFC 4122 variant), built
+        # straight from the hex digits without the UUID object round-trip.
+        digits = os.urandom(16).hex()
+        variant = "89ab"[int(digits[16], 16) & 3]
+        return (
+            f"{digits[:8]}-{digits[8:12]}-4{digits[13:16]}-"
+            f"{variant}{digits[17:20]}-{digits[20:]}"
+        )
 
     def _headers(
         self,
@@ -53,13 +138,10 @@ class ThermoFisherClient:
         accept: str = "application/json",
         content_type: Optional[str] = None,
     ) -> Dict[str, str]:
-        headers: Dict[str, str] = {
-            "Accept": accept,
-            "Origin": BASE_HOST,
-            "Referer": referer,
-            "country": self.country,
-            "com-tf-dye": self._random_dye(),
-        }
+        headers = self._base_headers.copy()
+        headers["Accept"] = accept
+        headers["Referer"] = referer
+        headers["com-tf-dye"] = self._random_dye()
         if content_type:
             headers["Content-Type"] = content_type
         return headers
@@ -81,8 +163,17 @@ class ThermoFisherClient:
         response = self.session.request(
             method, url, headers=headers, timeout=timeout, **kwargs
         )
+        if response.status_code in (401, 403):
+            # Cookies are seeded once per run; when the API rejects them,
+            # load the referring page to refresh them and try once more.
+            self.ensure_page_loaded(referer, force=True)
+            headers["com-tf-dye"] = self._random_dye()
+            response = self.session.request(
+                method, url, headers=headers, timeout=timeout, **kwargs
+            )
         response.raise_for_status()
-        payload = response.json()
+        # Decoded from the raw body (orjson when installed), skipping .text.
+        payload = json_loads(response.content)
         if payload.get("code") != "200":
             raise ValueError(f"API responded with error: {payload}")
         data = payload.get("data")
@@ -90,9 +181,9 @@ class ThermoFisherClient:
             raise ValueError(f"API returned no data: {payload}")
         return data  # type: ignore[return-value]
 
-    def ensure_page_loaded(self, url: str) -> None:
+    def ensure_page_loaded(self, url: str, *, force: bool = False) -> None:
         """Load page once to establish cookies expected by API."""
-        if url in self._prefetched:
+        if url in self._prefetched and not force:
             return
         response = self.session.get(url, headers={"User-Agent": USER_AGENT}, timeout=60)
         response.raise_for_status()
@@ -107,20 +198,17 @@ class ThermoFisherClient:
         language: str,
         referer: str,
     ) -> Dict[str, object]:
-        payload = {
-            "categoryId": category_id,
-            "pageNo": page,
-            "pageSize": page_size,
-            "filter": "",
-            "countryCode": self.country,
-            "language": language,
-        }
+        payload = self._category_payload.copy()
+        payload["categoryId"] = category_id
+        payload["pageNo"] = page
+        payload["pageSize"] = page_size
+        payload["language"] = language
         return self._request_json(
             "POST",
             CATEGORY_ENDPOINT,
             referer=referer,
             content_type="application/json",
-            json=payload,
+            data=json_dumps(payload),
         )
 
     def search_catalog(
@@ -132,40 +220,41 @@ class ThermoFisherClient:
         page: int = 1,
         page_size: int = 10,
     ) -> Dict[str, object]:
-        payload = {
-            "countryCode": self.country,
-            "language": language,
-            "filter": "",
-            "pageNo": page,
-            "pageSize": page_size,
-            "persona": "",
-            "query": query,
-        }
+        payload = self._search_payload.copy()
+        payload["language"] = language
+        payload["pageNo"] = page
+        payload["pageSize"] = page_size
+        payload["query"] = query
         return self._request_json(
             "POST",
             SEARCH_ENDPOINT,
             referer=referer,
             content_type="application/json",
-            json=payload,
+            data=json_dumps(payload),
         )
 
     def fetch_child_skus(
         self, catalog_number: str, *, product_referer: str
     ) -> List[str]:
+        cached = self._child_sku_cache.get(catalog_number)
+        if cached is not None:
+            return list(cached)
         data = self._request_json(
             "POST",
             CHILD_ENDPOINT,
             referer=product_referer,
             content_type="application/json",
-            json={"catalogNumber": catalog_number},
+            data=json_dumps({"catalogNumber": catalog_number}),
         )
         children: List[Dict[str, str]] = data  # type: ignore[assignment]
-        return [
+        child_skus = [
             child["childCatalogNumber"]
             for child in children
             if child.get("childCatalogNumber")
             and (child.get("skuStatus") or "").upper() == "RELEASED"
         ]
+        self._child_sku_cache[catalog_number] = child_skus
+        return list(child_skus)
 
     def resolve_product_from_search(
         self,
@@ -192,6 +281,10 @@ class ThermoFisherClient:
         language: str,
         product_referer: str,
     ) -> str:
+        cache_key = (tuple(sorted(child_skus)), language)
+        cached = self._sds_url_cache.get(cache_key)
+        if cached is not None:
+            return cached
         params = {
             "childSkus": ",".join(child_skus),
             "language": language,
@@ -205,6 +298,7 @@ class ThermoFisherClient:
         url = data if isinstance(data, str) else data.get("data")  # type: ignore[arg-type]
         if not isinstance(url, str) or not url.startswith("http"):
             raise ValueError(f"No SDS URL returned for {child_skus}")
+        self._sds_url_cache[cache_key] = url
         return url
 
     def download_pdf(
@@ -213,20 +307,72 @@ class ThermoFisherClient:
         *,
         product_referer: str,
         timeout: int = 120,
+        validators: Optional[Dict[str, str]] = None,
     ) -> requests.Response:
+        """Request ``pdf_url`` and return the response with its body still unread.
+
+        The caller streams the body (``iter_content``) and must close the
+        response, which hands the connection back to the pool. With
+        ``validators`` (a cached ``etag`` / ``lastModified``) the request is
+        conditional and may come back as ``304 Not Modified`` without a body.
+        """
         headers = self._headers(
             referer=product_referer,
             accept="application/pdf,application/octet-stream,*/*",
         )
-        response = self.session.get(pdf_url, headers=headers, timeout=timeout)
-        response.raise_for_status()
-        content_type = response.headers.get("Content-Type", "").lower()
-        if "pdf" not in content_type:
-            raise ValueError(f"Unexpected content type: {content_type}")
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("lastModified"):
+                headers["If-Modified-Since"] = validators["lastModified"]
+        response = self.session.get(pdf_url, headers=headers, timeout=timeout, stream=True)
+        try:
+            response.raise_for_status()
+            if response.status_code == 304:
+                return response
+            content_type = response.headers.get("Content-Type", "").lower()
+            if "pdf" not in content_type:
+                raise ValueError(f"Unexpected content type: {content_type}")
+        except Exception:
+            response.close()
+            raise
         return response
 
 
+_CLIENT: Optional[ThermoFisherClient] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_client(
+    country: str = "kr", *, cache: Optional[JsonCache] = None
+) -> ThermoFisherClient:
+    """Return the module-wide client, creating it on first use or for another
+    country or cache directory.
+
+    Repeated calls from library code or tests with the same ``country`` and
+    cache directory (or no cache) reuse one session, its pooled connections
+    and its cookies.
+    """
+    global _CLIENT
+    cache_dir = cache.directory if cache else None
+    with _CLIENT_LOCK:
+        if (
+            _CLIENT is None
+            or _CLIENT.country != country
+            or (_CLIENT.cache.directory if _CLIENT.cache else None) != cache_dir
+        ):
+            _CLIENT = ThermoFisherClient(country, cache=cache)
+        return _CLIENT
+
+
 def extract_last_segment(url: str, keyword: str) -> str:
+    pattern = URL_SEGMENT_RES.get(keyword)
+    if pattern:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+    # Unusual URLs (other keywords, nothing after the keyword) keep the
+    # original segment-by-segment behaviour.
     parsed = urlparse(url)
     parts = [segment for segment in parsed.path.split("/") if segment]
     if keyword in parts:
@@ -255,7 +401,6 @@ def iter_category_products(
     max_products: Optional[int],
 ) -> Iterator[Dict[str, str]]:
     category_url = f"{APAC_BASE}/search/category/{category_id}"
-    client.ensure_page_loaded(category_url)
     fetched = 0
     page = 1
 
@@ -287,7 +432,6 @@ def collect_child_skus(
     seed_child_sku: str,
 ) -> List[str]:
     product_url = f"{APAC_BASE}/product/{root_sku}"
-    client.ensure_page_loaded(product_url)
     child_skus = client.fetch_child_skus(
         seed_child_sku,
         product_referer=product_url,
@@ -298,44 +442,277 @@ def collect_child_skus(
     return sorted(set(child_skus))
 
 
-def download_for_product(
+def validators_key(pdf_url: str, destination: Path) -> str:
+    # Products sharing one PDF URL save it under different names; each file
+    # is revalidated on its own.
+    return f"{pdf_url} -> {destination}"
+
+
+def cached_validators(
+    client: ThermoFisherClient, pdf_url: str, destination: Path
+) -> Optional[Dict[str, str]]:
+    """Return the stored validators for ``pdf_url`` if its file is still on disk."""
+    if not client.cache:
+        return None
+    entry = client.cache.get(validators_key(pdf_url, destination))
+    if not isinstance(entry, dict) or not destination.exists():
+        return None
+    return entry
+
+
+def store_validators(
+    client: ThermoFisherClient,
+    pdf_url: str,
+    destination: Path,
+    response: requests.Response,
+) -> None:
+    if not client.cache:
+        return
+    key = validators_key(pdf_url, destination)
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        client.cache.set(key, {"etag": etag, "lastModified": last_modified})
+    else:
+        # The new file must not be revalidated with the old file's validators.
+        client.cache.delete(key)
+
+
+def resolve_language_url(
     client: ThermoFisherClient,
     *,
     root_sku: str,
     child_skus: Sequence[str],
-    languages: Sequence[str],
+    language: str,
+) -> Optional[str]:
+    try:
+        return client.fetch_sds_url(
+            child_skus,
+            language=language,
+            product_referer=f"{APAC_BASE}/product/{root_sku}",
+        )
+    except Exception as exc:  # noqa: BLE001
+        print(f"[WARN] {root_sku} ({language}): {exc}")
+        return None
+
+
+def download_language(
+    client: ThermoFisherClient,
+    *,
+    root_sku: str,
+    pdf_url: str,
+    language: str,
     output_dir: Path,
-) -> List[DownloadRecord]:
+    drop_cache: bool = False,
+) -> Optional[DownloadRecord]:
     product_url = f"{APAC_BASE}/product/{root_sku}"
-    records: List[DownloadRecord] = []
-    for language in languages:
-        try:
-            pdf_url = client.fetch_sds_url(
-                child_skus,
-                language=language,
-                product_referer=product_url,
-            )
-            response = client.download_pdf(
-                pdf_url,
-                product_referer=product_url,
-            )
-            file_name = f"{root_sku}_{language.upper()}.pdf"
-            destination = output_dir / file_name
-            destination.write_bytes(response.content)
-            records.append(
-                DownloadRecord(
+    destination = output_dir / f"{root_sku}_{language.upper()}.pdf"
+    try:
+        validators = cached_validators(client, pdf_url, destination)
+        with client.download_pdf(
+            pdf_url, product_referer=product_url, validators=validators
+        ) as response:
+            if response.status_code == 304:
+                print(f"[OK] {root_sku} ({language}) -> {destination} (not modified)")
+                return DownloadRecord(
                     path=destination,
                     languages=[language],
                     source_url=pdf_url,
                     metadata={"rootSku": root_sku},
                 )
+            with atomic_write(destination, drop_cache=drop_cache) as handle:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    handle.write(chunk)
+    except Exception as exc:  # noqa: BLE001
+        print(f"[WARN] {root_sku} ({language}): {exc}")
+        return None
+    # Outside the try: the PDF is saved even if its validators cannot be.
+    store_validators(client, pdf_url, destination, response)
+    print(f"[OK] {root_sku} ({language}) -> {destination}")
+    return DownloadRecord(
+        path=destination,
+        languages=[language],
+        source_url=pdf_url,
+        metadata={"rootSku": root_sku},
+    )
+
+
+def link_language(
+    record: DownloadRecord,
+    *,
+    root_sku: str,
+    language: str,
+    output_dir: Path,
+) -> Optional[DownloadRecord]:
+    """Expose an already downloaded PDF under another language's file name."""
+    destination = output_dir / f"{root_sku}_{language.upper()}.pdf"
+    try:
+        if not (destination.exists() and os.path.samefile(record.path, destination)):
+            temp_path = temp_path_for(destination)
+            try:
+                try:
+                    os.link(record.path, temp_path)
+                except OSError:
+                    # Filesystems without hard links still get a regular copy.
+                    shutil.copyfile(record.path, temp_path)
+                os.replace(temp_path, destination)
+            except BaseException:
+                temp_path.unlink(missing_ok=True)
+                raise
+    except OSError as exc:
+        print(f"[WARN] {root_sku} ({language}): {exc}")
+        return None
+    print(
+        f"[OK] {root_sku} ({language}) -> {destination} "
+        f"(same file as {record.path.name})"
+    )
+    return DownloadRecord(
+        path=destination,
+        languages=[language],
+        source_url=record.source_url,
+        metadata={"rootSku": root_sku},
+    )
+
+
+def download_for_product(
+    client: ThermoFisherClient,
+    *,
+    root_sku: str,
+    child_skus: Sequence[str],
+    languages: Sequence[str],
+    output_dir: Path,
+    drop_cache: bool = False,
+) -> List[DownloadRecord]:
+    def resolve(language: str) -> Optional[str]:
+        return resolve_language_url(
+            client, root_sku=root_sku, child_skus=child_skus, language=language
+        )
+
+    def download(item: Tuple[str, str]) -> Optional[DownloadRecord]:
+        pdf_url, language = item
+        return download_language(
+            client,
+            root_sku=root_sku,
+            pdf_url=pdf_url,
+            language=language,
+            output_dir=output_dir,
+            drop_cache=drop_cache,
+        )
+
+    if len(languages) <= 1:
+        pdf_urls = [resolve(language) for language in languages]
+    else:
+        # The SDS URL lookups of each language are independent, so they
+        # overlap instead of adding up. A per-product pool keeps the
+        # product-level workers from waiting on their own queue.
+        workers = min(len(languages), LANGUAGE_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pdf_urls = list(pool.map(resolve, languages))
+
+    # Several languages often resolve to the same PDF (e.g. an English-only
+    # SDS); each distinct URL is fetched once by the first language using it.
+    seen_urls: Dict[str, str] = {}
+    for language, pdf_url in zip(languages, pdf_urls):
+        if pdf_url:
+            seen_urls.setdefault(pdf_url, language)
+    if len(seen_urls) <= 1:
+        downloads = [download(item) for item in seen_urls.items()]
+    else:
+        workers = min(len(seen_urls), LANGUAGE_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            downloads = list(pool.map(download, seen_urls.items()))
+    downloaded = dict(zip(seen_urls, downloads))
+
+    records: List[DownloadRecord] = []
+    for language, pdf_url in zip(languages, pdf_urls):
+        record = downloaded.get(pdf_url) if pdf_url else None
+        if record is None:
+            continue
+        if seen_urls[pdf_url] != language:
+            record = link_language(
+                record, root_sku=root_sku, language=language, output_dir=output_dir
             )
-            print(f"[OK] {root_sku} ({language}) -> {destination}")
-        except Exception as exc:  # noqa: BLE001
-            print(f"[WARN] {root_sku} ({language}): {exc}")
+            if record is None:
+                continue
+        records.append(record)
     return records
 
 
+def process_product(
+    client: ThermoFisherClient,
+    *,
+    root_sku: str,
+    seed_child_sku: str,
+    languages: Sequence[str],
+    output_dir: Path,
+    drop_cache: bool = False,
+) -> List[DownloadRecord]:
+    child_skus = collect_child_skus(client, root_sku, seed_child_sku)
+    return download_for_product(
+        client,
+        root_sku=root_sku,
+        child_skus=child_skus,
+        languages=languages,
+        output_dir=output_dir,
+        drop_cache=drop_cache,
+    )
+
+
+def process_product_url(
+    client: ThermoFisherClient,
+    url: str,
+    *,
+    languages: Sequence[str],
+    output_dir: Path,
+) -> List[DownloadRecord]:
+    root = extract_last_segment(url, "product")
+    search_referer = url
+    try:
+        data = client.search_catalog(
+            root,
+            language=languages[0],
+            referer=search_referer,
+        )
+    except Exception as exc:  # noqa: BLE001
+        print(f"[WARN] Search failed for {root}: {exc}")
+        return []
+    results: List[Dict[str, str]] = data.get("catalogResultDTOs", [])  # type: ignore[assignment]
+    if not results:
+        print(f"[WARN] No catalog results for {root}")
+        return []
+    child = results[0].get("childCatalogNumber", root)
+    return process_product(
+        client,
+        root_sku=root,
+        seed_child_sku=child,
+        languages=languages,
+        output_dir=output_dir,
+    )
+
+
+def collect_product_results(
+    pool: ThreadPoolExecutor,
+    submitted: Sequence[Tuple[str, Future[List[DownloadRecord]]]],
+) -> Tuple[List[DownloadRecord], List[str]]:
+    """Gather per-product results in submission order.
+
+    The first failing product cancels the products that have not started yet
+    and its error propagates, as it did when products ran one after another.
+    """
+    records: List[DownloadRecord] = []
+    processed: List[str] = []
+    for root, future in submitted:
+        try:
+            product_records = future.result()
+        except BaseException:
+            pool.shutdown(cancel_futures=True)
+            raise
+        if product_records:
+            processed.append(root)
+            records.extend(product_records)
+    return records, processed
+
+
 def handle_category_mode(
     client: ThermoFisherClient,
     *,
@@ -346,31 +723,42 @@ def handle_category_mode(
     output_dir: Path,
 ) -> Tuple[List[DownloadRecord], Dict[str, object]]:
     category_id = extract_last_segment(category_url, "category")
-    records: List[DownloadRecord] = []
-    processed: List[str] = []
-    for product in iter_category_products(
-        client,
-        category_id,
-        language=languages[0],
-        page_size=page_size,
-        max_products=max_products,
-    ):
-        root = product.get("rootCatalogNumber")
-        child = product.get("childCatalogNumber")
-        if not root or not child:
-            print(f"[WARN] Skipping product entry without SKUs: {product}")
-            continue
-        child_skus = collect_child_skus(client, root, child)
-        product_records = download_for_product(
+    # The work is network-bound and requests releases the GIL while waiting.
+    # Products are submitted as soon as their category page arrives, so the
+    # child-SKU lookups and downloads of page N overlap fetching page N+1.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        # A product listed twice reuses its first future instead of writing
+        # the same files from two workers at once.
+        futures: Dict[str, Future[List[DownloadRecord]]] = {}
+        submitted: List[Tuple[str, Future[List[DownloadRecord]]]] = []
+        for product in iter_category_products(
             client,
-            root_sku=root,
-            child_skus=child_skus,
-            languages=languages,
-            output_dir=output_dir,
-        )
-        if product_records:
-            processed.append(root)
-            records.extend(product_records)
+            category_id,
+            language=languages[0],
+            page_size=page_size,
+            max_products=max_products,
+        ):
+            root = product.get("rootCatalogNumber")
+            child = product.get("childCatalogNumber")
+            if not root or not child:
+                print(f"[WARN] Skipping product entry without SKUs: {product}")
+                continue
+            future = futures.get(root)
+            if future is None:
+                future = pool.submit(
+                    process_product,
+                    client,
+                    root_sku=root,
+                    seed_child_sku=child,
+                    languages=languages,
+                    output_dir=output_dir,
+                    # Category runs write many PDFs that are not read back;
+                    # keep them out of the page cache.
+                    drop_cache=True,
+                )
+                futures[root] = future
+            submitted.append((root, future))
+        records, processed = collect_product_results(pool, submitted)
     notes: Dict[str, object] = {
         "mode": "category",
         "categoryId": category_id,
@@ -387,37 +775,23 @@ def handle_product_mode(
     languages: Sequence[str],
     output_dir: Path,
 ) -> Tuple[List[DownloadRecord], Dict[str, object]]:
-    records: List[DownloadRecord] = []
-    processed: List[str] = []
-    for url in product_urls:
-        root = extract_last_segment(url, "product")
-        client.ensure_page_loaded(url)
-        search_referer = url
-        try:
-            data = client.search_catalog(
-                root,
-                language=languages[0],
-                referer=search_referer,
-            )
-        except Exception as exc:  # noqa: BLE001
-            print(f"[WARN] Search failed for {root}: {exc}")
-            continue
-        results: List[Dict[str, str]] = data.get("catalogResultDTOs", [])  # type: ignore[assignment]
-        if not results:
-            print(f"[WARN] No catalog results for {root}")
-            continue
-        child = results[0].get("childCatalogNumber", root)
-        child_skus = collect_child_skus(client, root, child)
-        product_records = download_for_product(
-            client,
-            root_sku=root,
-            child_skus=child_skus,
-            languages=languages,
-            output_dir=output_dir,
-        )
-        if product_records:
-            processed.append(root)
-            records.extend(product_records)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures: Dict[str, Future[List[DownloadRecord]]] = {}
+        submitted: List[Tuple[str, Future[List[DownloadRecord]]]] = []
+        for url in product_urls:
+            root = extract_last_segment(url, "product")
+            future = futures.get(root)
+            if future is None:
+                future = pool.submit(
+                    process_product_url,
+                    client,
+                    url,
+                    languages=languages,
+                    output_dir=output_dir,
+                )
+                futures[root] = future
+            submitted.append((root, future))
+        records, processed = collect_product_results(pool, submitted)
     notes: Dict[str, object] = {"mode": "product", "products": processed}
     return records, notes
 
@@ -464,6 +838,11 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Limit number of products processed from a category.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always download PDFs in full instead of revalidating previously saved files.",
+    )
     return parser.parse_args()
 
 
@@ -473,12 +852,16 @@ def main() -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     languages = resolve_languages(args.languages)
-    client = ThermoFisherClient()
+    cache = None if args.no_cache else JsonCache(CACHE_DIR)
+    client = get_client(cache=cache)
     all_records: List[DownloadRecord] = []
     notes: Dict[str, object] = {}
     product_url = None
 
     try:
+        # One page load seeds the cookies every API call reuses; _request_json
+        # reloads the referring page only if the API rejects them.
+        client.ensure_page_loaded(BASE_HOST)
         if args.category_url:
             all_records, notes = handle_category_mode(
                 client,